@@ -1,16 +1,55 @@
 #!/usr/bin/env python3
 
-import json
+import atexit
+import copy
+import functools
 import os
-import platform
+import queue
+import re
 import shutil
 import signal
+import socket
 import subprocess
 import sys
+import threading
 import time
+from types import MappingProxyType
+
+try:
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    # json is imported on first use, keeping it off the daemon's startup;
+    # after that the import is a sys.modules lookup
+    def _json_dumps(data):
+        import json
+
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    def _json_loads(data):
+        import json
+
+        return json.loads(data)
 
 
 _LOG_HANDLE = None
+_STOP = threading.Event()
+_LAST_TS = (None, "")
+_LAST_FLUSH = 0.0
+LOG_FLUSH_INTERVAL = 1.0
+_URGENT_WORDS = ("fail", "error", "exit", "[warn]")
+_CFG_CACHE = {"path": None, "mtime": None, "data": None}
+_ADB_SERVER_STARTED = False
+ADB_SERVER_ADDR = ("127.0.0.1", int(os.environ.get("ANDROID_ADB_SERVER_PORT", "5037")))
+_PROPS_CACHE = {}
+_MODEL_CACHE = {}
+_LAST_APPLIED_TZ = None
+_PROBE_CACHE = {}
+PROBE_REUSE_WINDOW = 2.0
 
 
 def _open_log_file():
@@ -26,16 +65,48 @@ def _open_log_file():
 
 
 def log(message):
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    global _LAST_TS
+    # several lines usually land in the same second; format it only once
+    now = int(time.time())
+    if now != _LAST_TS[0]:
+        _LAST_TS = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+    timestamp = _LAST_TS[1]
     line = f"[{timestamp}] {message}"
-    print(line, flush=True)
+    print(line)
     if _LOG_HANDLE:
         try:
             _LOG_HANDLE.write(line + "\n")
-            _LOG_HANDLE.flush()
         except Exception:
             pass
 
+    # flush in batches, but never sit on warnings/errors
+    lowered = message.lower()
+    if (
+        time.monotonic() - _LAST_FLUSH > LOG_FLUSH_INTERVAL
+        or any(word in lowered for word in _URGENT_WORDS)
+    ):
+        flush_log()
+
+
+def flush_log():
+    global _LAST_FLUSH
+    _LAST_FLUSH = time.monotonic()
+    try:
+        sys.stdout.flush()
+        if _LOG_HANDLE:
+            _LOG_HANDLE.flush()
+    except Exception:
+        pass
+
+
+def _idle(seconds):
+    """
+    Wait between daemon ticks, flushing pending log lines first. Returns True
+    as soon as shutdown was requested, so callers can bail out immediately.
+    """
+    flush_log()
+    return _STOP.wait(seconds)
+
 
 def close_log():
     global _LOG_HANDLE
@@ -46,37 +117,76 @@ def close_log():
         _LOG_HANDLE = None
 
 
+# runs last-registered-first: close (and so flush) LOG_FILE, then stdout
+atexit.register(flush_log)
+atexit.register(close_log)
+
+
+
+# Our own descriptors are non-inheritable (PEP 446), so there is nothing for
+# close_fds to do; leaving it off and passing an absolute path lets CPython
+# start children with posix_spawn instead of fork + exec.
+_SPAWN_OPTS = {"close_fds": False} if os.name == "posix" else {}
+
+
+@functools.lru_cache(maxsize=None)
+def _exe_path(name):
+    return shutil.which(name) or name
+
+
+def _argv(cmd):
+    return [_exe_path(cmd[0])] + list(cmd[1:])
+
 
 def run(cmd, check=False):
     """Wrapper around subprocess.run with captured text output."""
-    return subprocess.run(cmd, check=check, capture_output=True, text=True)
+    return subprocess.run(
+        _argv(cmd), check=check, capture_output=True, text=True, **_SPAWN_OPTS
+    )
 
 
-def have(cmd):
-    return shutil.which(cmd) is not None
+def run_quiet(cmd):
+    """Run cmd for its exit status only; output goes to DEVNULL instead of pipes."""
+    return subprocess.run(
+        _argv(cmd), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **_SPAWN_OPTS
+    )
 
 
-def os_is_windows():
-    return platform.system().lower().startswith("win")
+def run_stderr(cmd):
+    """Like run_quiet, but keep raw stderr bytes for error reporting."""
+    return subprocess.run(
+        _argv(cmd), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, **_SPAWN_OPTS
+    )
 
 
-def is_root_linux():
-    if os_is_windows():
-        return False
-    try:
-        return os.geteuid() == 0
-    except AttributeError:
-        return False
+def stderr_text(proc):
+    return (proc.stderr or b"").decode("utf-8", "replace").strip()
 
 
+def have(cmd):
+    return shutil.which(cmd) is not None
+
+
+# Host facts that cannot change while the process runs; resolved once at
+# import instead of walking PATH / asking the OS on every sync.
+IS_WINDOWS = os.name == "nt"
+IS_ROOT = not IS_WINDOWS and getattr(os, "geteuid", lambda: -1)() == 0
+HAS_ADB = have("adb")
+HAS_TIMEDATECTL = have("timedatectl")
+HAS_PKEXEC = have("pkexec")
+HAS_SUDO = have("sudo")
+
+
+@functools.lru_cache(maxsize=None)
 def config_path():
-    if os_is_windows():
+    """Resolve (and create) the config directory once per process."""
+    if IS_WINDOWS:
         base = os.environ.get("PROGRAMDATA", r"C:\ProgramData")
         cfg_dir = os.path.join(base, "PhoneTimeSync")
         os.makedirs(cfg_dir, exist_ok=True)
         return os.path.join(cfg_dir, "config.json")
 
-    if is_root_linux():
+    if IS_ROOT:
         cfg_dir = "/etc/toadb"
     else:
         cfg_dir = os.path.expanduser("~/.config/toadb")
@@ -85,22 +195,56 @@ def config_path():
 
 
 def load_cfg():
+    """Return the parsed config, reusing the cached copy while the file is unchanged."""
     path = config_path()
-    if os.path.exists(path):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {}
-    return {}
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    if _CFG_CACHE["path"] == path and _CFG_CACHE["mtime"] == mtime:
+        return copy.deepcopy(_CFG_CACHE["data"])
+    try:
+        with open(path, "rb") as f:
+            # key the cache on the file we actually read, not the earlier stat
+            mtime = os.fstat(f.fileno()).st_mtime_ns
+            data = _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    _CFG_CACHE.update(path=path, mtime=mtime, data=data)
+    return copy.deepcopy(data)
+
+
+def _invalidate_cfg_cache():
+    _CFG_CACHE.update(path=None, mtime=None, data=None)
 
 
 def save_cfg(cfg):
-    with open(config_path(), "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+    """
+    Write cfg atomically: a kill mid-write leaves the previous file intact.
+    Skips the write (and fsync) entirely when the file already holds cfg.
+    """
+    path = config_path()
+    payload = _json_dumps(cfg)
+    try:
+        with open(path, "rb") as f:
+            if f.read() == payload:
+                return
+    except OSError:
+        pass
+
+    _invalidate_cfg_cache()
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    # seed the cache with what was just written so the next load skips the parse
+    _CFG_CACHE.update(path=path, mtime=os.stat(path).st_mtime_ns, data=copy.deepcopy(cfg))
 
 
 def reset_cfg():
+    _invalidate_cfg_cache()
     path = config_path()
     try:
         os.remove(path)
@@ -109,25 +253,223 @@ def reset_cfg():
 
 
 
+# serial and state columns of each `adb devices` row, skipping the header
+_DEVICE_RE = re.compile(r"^[ \t]*(?!List of devices)(\S+)[ \t]+(\S+)", re.M)
+
+
 def parse_adb_devices(text):
-    devices = []
-    for line in text.splitlines():
-        line = line.strip()
-        if not line or line.startswith("List of devices"):
-            continue
-        parts = line.split()
-        if len(parts) >= 2:
-            devices.append((parts[0], parts[1]))
-    return devices
+    return _DEVICE_RE.findall(text)
+
+
+def ensure_adb_server():
+    """Run `adb start-server` once; later calls are free until an adb error resets the flag."""
+    global _ADB_SERVER_STARTED
+    if not _ADB_SERVER_STARTED:
+        run_quiet(["adb", "start-server"])
+        _ADB_SERVER_STARTED = True
+
+
+def _adb_server_lost():
+    global _ADB_SERVER_STARTED
+    _ADB_SERVER_STARTED = False
+
+
+def _adb_connect():
+    """Socket to the adb server; a refused connection means it needs starting again."""
+    try:
+        return socket.create_connection(ADB_SERVER_ADDR, timeout=2)
+    except ConnectionRefusedError:
+        _adb_server_lost()
+        raise
+
+
+def _recv_exact(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise OSError("adb server closed the connection")
+        data += chunk
+    return data
+
+
+def _adb_request(sock, service):
+    """Send a smart-socket request to the adb server and check its OKAY/FAIL reply."""
+    payload = service.encode("utf-8")
+    sock.sendall(b"%04x" % len(payload) + payload)
+    if _recv_exact(sock, 4) != b"OKAY":
+        raise OSError(f"adb server refused {service}")
+
+
+def _adb_rpc(service):
+    """
+    One-shot `host:` query straight to the adb server, as the adb client
+    itself would make it; returns the length-prefixed reply as text.
+    """
+    with _adb_connect() as sock:
+        _adb_request(sock, service)
+        size = int(_recv_exact(sock, 4), 16)
+        return _recv_exact(sock, size).decode("utf-8", "replace")
+
+
+def adb_device_state(serial):
+    """State of one serial straight from the adb server; "" if absent or unreachable."""
+    try:
+        return _adb_rpc(f"host-serial:{serial}:get-state").strip()
+    except (OSError, ValueError):
+        return ""
+
+
+def adb_wait_for_device(serial):
+    """
+    Block in the adb server until serial is in state `device`, as
+    `adb -s serial wait-for-device` does, but without the client process.
+    Falls back to that command if the server cannot be reached.
+    """
+    try:
+        with _adb_connect() as sock:
+            _adb_request(sock, f"host-serial:{serial}:wait-for-any-device")
+            # a second OKAY arrives once the device is ready
+            sock.settimeout(None)
+            if _recv_exact(sock, 4) == b"OKAY":
+                return
+    except OSError:
+        pass
+    run_quiet(["adb", "-s", serial, "wait-for-device"])
 
 
 def adb_devices():
+    """List (serial, state) pairs as the adb server reports them right now."""
     try:
-        result = run(["adb", "devices"])
-        return parse_adb_devices(result.stdout)
-    except FileNotFoundError:
-        log("adb not found. Install platform-tools and put adb on PATH.")
-        sys.exit(127)
+        # no adb client process when the server is already up
+        devices = parse_adb_devices(_adb_rpc("host:devices"))
+    except (OSError, ValueError):
+        try:
+            result = run(["adb", "devices"])
+        except FileNotFoundError:
+            log("adb not found. Install platform-tools and put adb on PATH.")
+            sys.exit(127)
+        if result.returncode != 0:
+            _adb_server_lost()
+        devices = parse_adb_devices(result.stdout)
+    return devices
+
+
+class DeviceTracker:
+    """
+    Persistent `host:track-devices` connection to the adb server. The server
+    pushes a fresh device list on every change, so the daemon can block on
+    the socket instead of forking `adb devices` every discovery tick.
+    """
+
+    def __init__(self):
+        self.sock = None
+        self.devices = None
+        self._buf = b""
+
+    def _open(self):
+        sock = _adb_connect()
+        try:
+            _adb_request(sock, "host:track-devices")
+        except OSError:
+            sock.close()
+            raise
+        self.sock, self.devices, self._buf = sock, None, b""
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+        self.sock, self._buf = None, b""
+
+    def _recv(self, timeout):
+        """Append whatever arrives within timeout to the buffer; False if nothing did."""
+        self.sock.settimeout(timeout)
+        try:
+            data = self.sock.recv(4096)
+        except (socket.timeout, BlockingIOError):
+            return False
+        except OSError:
+            data = b""
+        if not data:
+            # the server went away: have the next tick start it again
+            self.close()
+            _adb_server_lost()
+            return False
+        self._buf += data
+        return True
+
+    def _parse(self):
+        """Consume the complete snapshots in the buffer; True if any was parsed."""
+        updated = False
+        # each snapshot is a 4-hex-digit length followed by an `adb devices` body
+        while len(self._buf) >= 4:
+            try:
+                size = int(self._buf[:4], 16)
+            except ValueError:
+                # out of step with the stream: drop it and reopen on the next tick
+                self.close()
+                return False
+            if len(self._buf) < 4 + size:
+                break
+            body = self._buf[4:4 + size].decode("utf-8", "replace")
+            self._buf = self._buf[4 + size:]
+            self.devices = parse_adb_devices(body)
+            updated = True
+        return updated
+
+    def _pump(self, timeout):
+        """Read whatever arrives within timeout; True if a new snapshot was parsed."""
+        return self._recv(timeout) and self._parse()
+
+    def current(self):
+        """Latest device list without waiting on changes; None if the server is unreachable."""
+        if self.sock is None:
+            try:
+                self._open()
+            except OSError:
+                return None
+            # the server answers with the current list straight away
+            self._pump(2)
+        # drain everything queued since the last look, even across partial frames
+        while self.sock is not None and self._recv(0):
+            pass
+        self._parse()
+        if self.sock is None or self.devices is None:
+            return None
+        return list(self.devices)
+
+    def wait_for_device(self, seconds):
+        """
+        Block until a pushed snapshot lists a device or seconds pass. Falls back
+        to a plain wait when not connected. Returns True if shutdown was requested.
+        """
+        flush_log()
+        deadline = time.monotonic() + seconds
+        while not _STOP.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self.sock is None:
+                return _STOP.wait(remaining)
+            if self._pump(remaining) and self.devices:
+                return False
+        return True
+
+    def wait_for_state(self, serial, state="device"):
+        """
+        Block until a pushed snapshot shows serial in state. Returns False if
+        the server is unreachable, the stream dropped or shutdown was requested.
+        """
+        if self.current() is None:
+            return False
+        while not _STOP.is_set():
+            if any(s == serial and st == state for s, st in self.devices):
+                return True
+            if self.sock is None:
+                return False
+            # short slices so a shutdown request is noticed promptly
+            self._pump(1.0)
+        return False
 
 
 def first_online_device(devices):
@@ -137,110 +479,375 @@ def first_online_device(devices):
     return None
 
 
-def pick_serial(preferred):
+def pick_serial(preferred, devices=None, cfg=None):
     if preferred:
         return preferred
 
-    cfg = load_cfg()
+    if cfg is None:
+        cfg = load_cfg()
     saved = cfg.get("selected_serial")
 
-    devices = adb_devices()
-    serials = [s for s, _ in devices]
+    if devices is None:
+        devices = adb_devices()
 
-    if saved and saved in serials:
+    if saved and any(s == saved for s, _ in devices):
         return saved
 
     online = first_online_device(devices)
     if online:
         return online
 
-    if serials:
-        return serials[0]
+    if devices:
+        return devices[0][0]
     return None
 
 
-def wait_for_authorized(serial):
-    run(["adb", "start-server"])
-    subprocess.run(["adb", "-s", serial, "wait-for-device"], capture_output=True, text=True)
+class AdbShell:
+    """
+    Long-lived `adb -s SERIAL shell` fed through stdin, so a series of probes
+    pays the adb fork/exec and transport setup only once. Each command is
+    framed by an echoed sentinel carrying its exit status. A reader thread
+    drains stdout so a single command can be time-boxed on any platform.
+    """
+
+    # the quotes split the sentinel in the sent line, so a shell that echoes
+    # its input (PTY without shell_v2) cannot match the expanded form early
+    _SENTINEL_CMD = 'echo "__END""__$?__END__"'
+    _SENTINEL_RE = re.compile(r"__END__(\d+)__END__")
+
+    def __init__(self, serial):
+        self.serial = serial
+        self.proc = None
+        self._lines = None
+
+    def _spawn(self):
+        self.proc = subprocess.Popen(
+            _argv(["adb", "-s", self.serial, "shell"]),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            # vendor props may not be valid UTF-8; never let decoding kill the reader
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            **_SPAWN_OPTS,
+        )
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pump, args=(self.proc.stdout, self._lines), daemon=True
+        ).start()
+
+    @staticmethod
+    def _pump(stream, lines):
+        try:
+            for line in iter(stream.readline, ""):
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            # always signal the end, so run() reports rc -1 instead of blocking
+            lines.put(None)
+
+    def run(self, cmd, timeout=None):
+        """
+        Run cmd on the device; returns (returncode, stdout). rc is -1 when the
+        session died or timed out, in which case it is respawned on next use.
+        """
+        try:
+            if self.proc is None or self.proc.poll() is not None:
+                self._spawn()
+            self.proc.stdin.write(f"{cmd}; {self._SENTINEL_CMD}\n")
+            self.proc.stdin.flush()
+        except OSError:
+            self.close()
+            return -1, ""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        out = []
+        while True:
+            try:
+                if deadline is None:
+                    line = self._lines.get()
+                else:
+                    line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                line = None
+            if line is None:
+                self.close(kill=True)
+                return -1, "".join(out)
+            match = self._SENTINEL_RE.search(line)
+            if not match:
+                out.append(line)
+                continue
+            out.append(line[:match.start()])
+            return int(match.group(1)), "".join(out).replace("\r", "")
+
+    def close(self, kill=False):
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        if kill:
+            proc.kill()
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+_SHELLS = {}
+
+
+def adb_shell(serial):
+    """Shared AdbShell for serial, kept open across syncs until close_adb_shells()."""
+    shell = _SHELLS.get(serial)
+    if shell is None:
+        shell = _SHELLS[serial] = AdbShell(serial)
+    return shell
+
+
+def close_adb_shells():
+    while _SHELLS:
+        _SHELLS.popitem()[1].close()
+
+
+atexit.register(close_adb_shells)
 
+
+def adb_probe(serial, timeout=None):
+    """
+    Authorization check and phone_info() in one round-trip. A successful
+    result is kept briefly so the sync that normally follows can reuse it.
+    """
+    info = phone_info(adb_shell(serial), timeout=timeout)
+    if info.get("authorized"):
+        _PROBE_CACHE[serial] = (time.monotonic(), info)
+    return info
+
+
+def take_probe(serial):
+    """Pop a probe result younger than PROBE_REUSE_WINDOW, epoch aged to now."""
+    entry = _PROBE_CACHE.pop(serial, None)
+    if entry is None:
+        return None
+    age = time.monotonic() - entry[0]
+    if age >= PROBE_REUSE_WINDOW:
+        return None
+    info = dict(entry[1])
+    if "epoch" in info:
+        info["epoch"] += round(age)
+    return info
+
+
+def _authorized_probe(serial):
+    # bounded so a hung adbd cannot stall the loop past the startup window
+    return bool(adb_probe(serial, timeout=2).get("authorized"))
+
+
+def wait_for_authorized(serial, state=None, tracker=None):
+    # usually already authorized: probe before blocking on any stream or sleep.
+    # The probe result is cached, so sync_once reuses it instead of a second read.
+    if state is None:
+        state = adb_device_state(serial)
+    if state == "device" and _authorized_probe(serial):
+        log("ADB device authorized.")
+        return
+
+    # block on the server's pushed device lists until the serial turns
+    # `device`; resync has no daemon tracker, so it opens its own
+    flush_log()
+    own = tracker is None
+    if own:
+        tracker = DeviceTracker()
+    try:
+        if tracker.wait_for_state(serial) and _authorized_probe(serial):
+            log("ADB device authorized.")
+            return
+    finally:
+        if own:
+            tracker.close()
+    if _STOP.is_set():
+        return
+
+    # `wait-for-device` blocks in the adb server until the serial is in state
+    # `device` (i.e. authorized), so no `adb devices` polling is needed; the
+    # probe only confirms the shell answers, with a short pause if it doesn't.
     while True:
-        devices = dict(adb_devices())
-        state = devices.get(serial, "")
-        if state == "device":
-            probe = subprocess.run(
-                ["adb", "-s", serial, "shell", "echo", "ok"],
-                capture_output=True,
-                text=True,
-            )
-            if probe.returncode == 0 and "ok" in (probe.stdout or ""):
-                log("ADB device authorized.")
-                return
-        time.sleep(0.5)
-
-
-def phone_epoch(serial):
-    cmds = [
-        ["adb", "-s", serial, "shell", "date", "+%s"],
-        ["adb", "-s", serial, "shell", "toybox", "date", "+%s"],
-        ["adb", "-s", serial, "shell", "busybox", "date", "+%s"],
-        ["adb", "-s", serial, "shell", "sh", "-c", "date +%s"],
-    ]
-    for cmd in cmds:
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-        raw = (proc.stdout or "").strip()
-        if proc.returncode == 0 and raw.isdigit():
+        adb_wait_for_device(serial)
+        if _authorized_probe(serial):
+            log("ADB device authorized.")
+            return
+        if _STOP.wait(0.5):
+            return
+
+
+# every date variant in one round-trip; the first that prints digits wins
+_EPOCH_CMD = (
+    "date +%s 2>/dev/null || toybox date +%s 2>/dev/null"
+    " || busybox date +%s 2>/dev/null"
+)
+
+
+def phone_epoch(shell):
+    rc, out = shell.run(_EPOCH_CMD)
+    if rc != 0:
+        return None
+    for line in out.splitlines():
+        raw = line.strip()
+        if raw.isdigit():
             return int(raw)
     return None
 
 
-def phone_offset_hhmm(serial):
-    proc = subprocess.run(
-        ["adb", "-s", serial, "shell", "date", "+%z"],
-        capture_output=True,
-        text=True,
-    )
-    s = (proc.stdout or "").strip().replace("\r", "")
-    if proc.returncode == 0 and len(s) >= 5 and s[0] in "+-":
+def phone_offset_hhmm(shell):
+    rc, out = shell.run("date +%z")
+    s = out.strip()
+    if rc == 0 and len(s) >= 5 and s[0] in "+-":
         return s[:5]
     return None
 
 
-def phone_tz_id(serial):
+# one `[key]: [value]` line of a bare `getprop` dump
+_PROP_RE = re.compile(r"^\[([^\]]+)\]: \[(.*)\]\r?$", re.M)
+
+
+def read_props(shell, timeout=None):
+    """
+    All system properties from one `getprop` dump, cached per serial for
+    REFRESH_INTERVAL seconds so repeated lookups cost no round-trip.
+    """
+    ttl = float(os.environ.get("REFRESH_INTERVAL", "600"))
+    cached = _PROPS_CACHE.get(shell.serial)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    rc, out = shell.run("getprop", timeout=timeout)
+    props = dict(_PROP_RE.findall(out)) if rc == 0 else {}
+    if props:
+        _PROPS_CACHE[shell.serial] = (time.monotonic(), props)
+    return props
+
+
+def phone_tz_id(shell):
     """Try to get IANA timezone id from the phone."""
-    candidates = (
-        ["adb", "-s", serial, "shell", "getprop", "persist.sys.timezone"],
-        ["adb", "-s", serial, "shell", "settings", "get", "global", "time_zone"],
-    )
-    for cmd in candidates:
-        proc = run(cmd)
-        val = (proc.stdout or "").strip().replace("\r", "")
-        if proc.returncode == 0 and val and val.lower() != "null":
-            return val
+    val = read_props(shell).get("persist.sys.timezone", "").strip()
+    if val:
+        return val
+    rc, out = shell.run("settings get global time_zone")
+    val = out.strip()
+    if rc == 0 and val and val.lower() != "null":
+        return val
     return None
 
 
-def device_model(serial):
-    try:
-        res = run(["adb", "-s", serial, "shell", "getprop", "ro.product.model"])
-        model = (res.stdout or "").strip()
-        if model:
-            return model
-    except Exception:
-        pass
-    return "unknown-model"
+def phone_info(shell, timeout=None):
+    """
+    Read epoch, offset, timezone id and model in a single shell round-trip.
+    Fields that are missing or malformed are left out of the returned dict;
+    "authorized" is set once the shell answered at all.
+    """
+    # the fallbacks mirror phone_epoch/phone_tz_id so one round-trip normally suffices
+    script = (
+        'echo "AUTH=ok"; '
+        f'echo "EPOCH=$({_EPOCH_CMD})"; '
+        'echo "OFF=$(date +%z)"; '
+        't=$(getprop persist.sys.timezone); '
+        '[ -n "$t" ] || t=$(settings get global time_zone 2>/dev/null); '
+        'echo "TZ=$t"; '
+        'echo "MODEL=$(getprop ro.product.model)"'
+    )
+    rc, out = shell.run(script, timeout=timeout)
+    if rc != 0:
+        return {}
+
+    raw = dict(line.strip().split("=", 1) for line in out.splitlines() if "=" in line)
+    info = {"authorized": raw.get("AUTH") == "ok"}
+    epoch = raw.get("EPOCH", "")
+    if epoch.isdigit():
+        info["epoch"] = int(epoch)
+    off = raw.get("OFF", "")
+    if len(off) >= 5 and off[0] in "+-":
+        info["offset"] = off[:5]
+    tz = raw.get("TZ", "")
+    if tz and tz.lower() != "null":
+        info["tz"] = tz
+    if raw.get("MODEL"):
+        info["model"] = _MODEL_CACHE[shell.serial] = raw["MODEL"]
+    return info
+
+
+def device_model(shell, timeout=None):
+    props = read_props(shell, timeout=timeout)
+    return props.get("ro.product.model", "").strip() or "unknown-model"
+
+
+def device_model_cached(serial, cfg):
+    """
+    Look up the model in cfg["models"], then in what phone_info last read,
+    asking the phone (and persisting) only when both miss.
+    """
+    models = cfg.setdefault("models", {})
+    model = models.get(serial)
+    if model:
+        return model
+    # a probe has usually read it already; shell out only if not
+    # bounded: this runs before wait_for_authorized, when adbd may not answer
+    model = _MODEL_CACHE.get(serial) or device_model(adb_shell(serial), timeout=2)
+    if model != "unknown-model":
+        models[serial] = model
+        save_cfg(cfg)
+    return model
+
+
+def device_models(devices, cfg):
+    """
+    Models for the online devices, from cfg["models"] or probed concurrently
+    (adb calls are I/O bound) with a short timeout so a hung adbd cannot stall
+    the listing; such devices show as unknown-model. Newly learned models are
+    persisted in one write.
+    """
+    known = cfg.get("models", {})
+    shown = dict(known)
+    missing = [s for s, st in devices if st == "device" and s not in known]
+    if not missing:
+        return shown
+    learned = {s: _MODEL_CACHE[s] for s in missing if s in _MODEL_CACHE}
+    probe = [s for s in missing if s not in learned]
+    if probe:
+        # only `toadb list` gets here; keep the import off the daemon path
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=min(8, len(probe))) as pool:
+            futures = {pool.submit(device_model, adb_shell(s), 2): s for s in probe}
+            for future in as_completed(futures):
+                model = future.result()
+                if model != "unknown-model":
+                    learned[futures[future]] = model
+    shown.update(dict.fromkeys(missing, "unknown-model"))
+    shown.update(learned)
+    if learned:
+        cfg.setdefault("models", {}).update(learned)
+        save_cfg(cfg)
+    return shown
 
 
 
 def elevate_linux():
-    if is_root_linux():
+    if IS_ROOT:
         return
 
     exe = sys.executable
     args = [exe] + sys.argv
 
-    if have("pkexec"):
+    # exec replaces the process without running atexit: write out buffered lines
+    flush_log()
+    if HAS_PKEXEC:
         os.execvp("pkexec", ["pkexec"] + args)
-    if have("sudo"):
+    if HAS_SUDO:
         os.execvp("sudo", ["sudo"] + args)
 
     log("Need root privileges but neither pkexec nor sudo is available.")
@@ -266,41 +873,77 @@ def elevate_windows():
     ctypes.windll.shell32.ShellExecuteW(
         None, "runas", sys.executable, cmdline, None, 1
     )
+    flush_log()
     sys.exit(0)
 
 
 
-IANA_TO_WINDOWS = {
-    "UTC": "UTC",
-    "Etc/UTC": "UTC",
-    "America/Los_Angeles": "Pacific Standard Time",
-    "America/Denver": "Mountain Standard Time",
-    "America/Chicago": "Central Standard Time",
-    "America/New_York": "Eastern Standard Time",
-    "America/Phoenix": "US Mountain Standard Time",
-    "America/Anchorage": "Alaskan Standard Time",
-    "Pacific/Honolulu": "Hawaiian Standard Time",
-    "Europe/London": "GMT Standard Time",
-    "Europe/Berlin": "W. Europe Standard Time",
-    "Europe/Paris": "Romance Standard Time",
-    "Europe/Madrid": "Romance Standard Time",
-    "Europe/Rome": "W. Europe Standard Time",
-    "Europe/Warsaw": "Central European Standard Time",
-    "Europe/Moscow": "Russian Standard Time",
-    "Asia/Tehran": "Iran Standard Time",
-    "Asia/Jerusalem": "Israel Standard Time",
-    "Asia/Tokyo": "Tokyo Standard Time",
-    "Asia/Seoul": "Korea Standard Time",
-    "Asia/Shanghai": "China Standard Time",
-    "Asia/Hong_Kong": "China Standard Time",
-    "Asia/Kolkata": "India Standard Time",
-    "Asia/Kathmandu": "Nepal Standard Time",
-    "Australia/Sydney": "AUS Eastern Standard Time",
-    "Australia/Perth": "W. Australia Standard Time",
-    "America/Sao_Paulo": "E. South America Standard Time",
-    "America/Bogota": "SA Pacific Standard Time",
-    "Africa/Cairo": "Egypt Standard Time",
-    "Africa/Johannesburg": "South Africa Standard Time",
+@functools.lru_cache(maxsize=None)
+def windows_tz_maps():
+    """
+    (IANA id -> Windows zone, numeric offset -> Windows zone), built on first
+    use so Linux and the info commands never construct them. IANA keys are
+    lower-cased; look them up with tz_id.lower().
+    """
+    iana_to_windows = {
+        "UTC": "UTC",
+        "Etc/UTC": "UTC",
+        "America/Los_Angeles": "Pacific Standard Time",
+        "America/Denver": "Mountain Standard Time",
+        "America/Chicago": "Central Standard Time",
+        "America/New_York": "Eastern Standard Time",
+        "America/Phoenix": "US Mountain Standard Time",
+        "America/Anchorage": "Alaskan Standard Time",
+        "Pacific/Honolulu": "Hawaiian Standard Time",
+        "Europe/London": "GMT Standard Time",
+        "Europe/Berlin": "W. Europe Standard Time",
+        "Europe/Paris": "Romance Standard Time",
+        "Europe/Madrid": "Romance Standard Time",
+        "Europe/Rome": "W. Europe Standard Time",
+        "Europe/Warsaw": "Central European Standard Time",
+        "Europe/Moscow": "Russian Standard Time",
+        "Asia/Tehran": "Iran Standard Time",
+        "Asia/Jerusalem": "Israel Standard Time",
+        "Asia/Tokyo": "Tokyo Standard Time",
+        "Asia/Seoul": "Korea Standard Time",
+        "Asia/Shanghai": "China Standard Time",
+        "Asia/Hong_Kong": "China Standard Time",
+        "Asia/Kolkata": "India Standard Time",
+        "Asia/Kathmandu": "Nepal Standard Time",
+        "Australia/Sydney": "AUS Eastern Standard Time",
+        "Australia/Perth": "W. Australia Standard Time",
+        "America/Sao_Paulo": "E. South America Standard Time",
+        "America/Bogota": "SA Pacific Standard Time",
+        "Africa/Cairo": "Egypt Standard Time",
+        "Africa/Johannesburg": "South Africa Standard Time",
+    }
+    # Fallback when the phone's IANA id is unknown: map the numeric offset instead.
+    off_to_windows = {
+        "-0800": "Pacific Standard Time",
+        "-0700": "Mountain Standard Time",
+        "-0600": "Central Standard Time",
+        "-0500": "Eastern Standard Time",
+        "+0000": "UTC",
+        "+0100": "W. Europe Standard Time",
+        "+0200": "South Africa Standard Time",
+        "+0300": "Russian Standard Time",
+        "+0330": "Iran Standard Time",
+        "+0530": "India Standard Time",
+        "+0900": "Tokyo Standard Time",
+    }
+    return (
+        MappingProxyType({k.lower(): v for k, v in iana_to_windows.items()}),
+        MappingProxyType(off_to_windows),
+    )
+
+
+# Every full-hour offset tzdata has an Etc/GMT zone for (UTC-12 .. UTC+14).
+# POSIX-style names invert the sign: +0800 -> Etc/GMT-8, -0300 -> Etc/GMT+3.
+_ETC_GMT = {
+    **{f"+{h:02d}00": f"Etc/GMT-{h}" for h in range(1, 15)},
+    **{f"-{h:02d}00": f"Etc/GMT+{h}" for h in range(1, 13)},
+    "+0000": "Etc/GMT",
+    "-0000": "Etc/GMT",
 }
 
 
@@ -309,27 +952,14 @@ def etc_gmt_from_offset(hhmm):
     Map full-hour offsets to Etc/GMT zones.
     Example: +0800 -> Etc/GMT-8, -0300 -> Etc/GMT+3
     """
-    try:
-        sign = 1 if hhmm[0] == "+" else -1
-        hours = int(hhmm[1:3])
-        minutes = int(hhmm[3:5])
-        if minutes != 0:
-            return None
-        offset = -sign * hours
-        return f"Etc/GMT{offset:+d}".replace("+-", "-")
-    except Exception:
-        return None
+    return _ETC_GMT.get(hhmm)
 
 
 def set_timezone_linux(tz_id, off):
     # First try the phone's IANA timezone id
     if tz_id:
-        if have("timedatectl"):
-            proc = subprocess.run(
-                ["timedatectl", "set-timezone", tz_id],
-                capture_output=True,
-                text=True,
-            )
+        if HAS_TIMEDATECTL:
+            proc = run_quiet(["timedatectl", "set-timezone", tz_id])
             if proc.returncode == 0:
                 log(f"Linux timezone set to {tz_id}")
                 return True
@@ -337,7 +967,8 @@ def set_timezone_linux(tz_id, off):
         zonefile = os.path.join("/usr/share/zoneinfo", tz_id)
         if os.path.exists(zonefile):
             try:
-                subprocess.run(["ln", "-sf", zonefile, "/etc/localtime"], check=False)
+                if run_quiet(["ln", "-sf", zonefile, "/etc/localtime"]).returncode != 0:
+                    raise OSError("ln -sf /etc/localtime failed")
                 with open("/etc/timezone", "w", encoding="utf-8") as f:
                     f.write(tz_id + "\n")
                 log(f"Linux timezone set (symlink) to {tz_id}")
@@ -348,12 +979,8 @@ def set_timezone_linux(tz_id, off):
     # Fallback: try to infer Etc/GMT from numeric offset (full hour only)
     if off:
         etc_name = etc_gmt_from_offset(off)
-        if etc_name and have("timedatectl"):
-            proc = subprocess.run(
-                ["timedatectl", "set-timezone", etc_name],
-                capture_output=True,
-                text=True,
-            )
+        if etc_name and HAS_TIMEDATECTL:
+            proc = run_quiet(["timedatectl", "set-timezone", etc_name])
             if proc.returncode == 0:
                 log(f"Linux timezone set to {etc_name} (from offset {off})")
                 return True
@@ -362,111 +989,187 @@ def set_timezone_linux(tz_id, off):
     return False
 
 
-def set_timezone_windows(tz_id, off):
-    target = None
-
-    if tz_id and tz_id in IANA_TO_WINDOWS:
-        target = IANA_TO_WINDOWS[tz_id]
-
-    if not target and off:
-        off_map = {
-            "-0800": "Pacific Standard Time",
-            "-0700": "Mountain Standard Time",
-            "-0600": "Central Standard Time",
-            "-0500": "Eastern Standard Time",
-            "+0000": "UTC",
-            "+0100": "W. Europe Standard Time",
-            "+0200": "South Africa Standard Time",
-            "+0300": "Russian Standard Time",
-            "+0330": "Iran Standard Time",
-            "+0530": "India Standard Time",
-            "+0900": "Tokyo Standard Time",
-        }
-        target = off_map.get(off)
-
+def _windows_tz_target(tz_id, off):
+    iana_to_windows, off_to_windows = windows_tz_maps()
+    target = iana_to_windows.get((tz_id or "").lower()) or off_to_windows.get(off)
     if not target:
         log("Windows timezone unchanged (no mapping for phone tz/offset).")
-        return False
+    return target
 
-    ps_cmd = [
-        "powershell",
-        "-NoProfile",
-        "-Command",
-        f"try {{ Set-TimeZone -Id '{target}' -ErrorAction Stop; 'OK' }} "
-        "catch {{ 'ERR:'+$_ }}",
-    ]
-    proc = subprocess.run(ps_cmd, capture_output=True, text=True)
-    if proc.returncode == 0 and "OK" in (proc.stdout or ""):
-        log(f"Windows timezone set to {target}")
-        return True
 
-    msg = (proc.stdout or proc.stderr or "").strip()
-    log(f"Failed to set Windows timezone to {target}: {msg}")
-    return False
+def _powershell_apply(target=None, epoch=None):
+    """
+    Apply a Windows timezone and/or clock change in a single powershell launch.
+    Each step reports OK:<step> or ERR:<step>:<reason> on its own line.
+    Returns (ok_tz, ok_time); a step that was not requested is None.
+    """
+    steps = []
+    if target:
+        steps.append(
+            f"try {{ Set-TimeZone -Id '{target}' -ErrorAction Stop; 'OK:TZ' }} "
+            "catch { 'ERR:TZ:' + $_ }"
+        )
+    if epoch is not None:
+        steps.append(
+            "Stop-Service w32time -ErrorAction SilentlyContinue; "
+            # the timezone may have just changed in this same process
+            "[TimeZoneInfo]::ClearCachedData(); "
+            f"try {{ $t=[DateTimeOffset]::FromUnixTimeSeconds({epoch}).LocalDateTime; "
+            "Set-Date -Date $t -ErrorAction Stop | Out-Null; 'OK:TIME' } "
+            "catch { 'ERR:TIME:' + $_ }; "
+            "Start-Service w32time -ErrorAction SilentlyContinue"
+        )
+    if not steps:
+        return None, None
+
+    proc = run(["powershell", "-NoProfile", "-Command", "; ".join(steps)])
+    lines = [line.strip() for line in (proc.stdout or "").splitlines()]
+
+    def error(step):
+        prefix = f"ERR:{step}:"
+        for line in lines:
+            if line.startswith(prefix):
+                return line[len(prefix):].strip()
+        return (proc.stderr or "").strip()
+
+    ok_tz = ok_time = None
+    if target:
+        ok_tz = "OK:TZ" in lines
+        if ok_tz:
+            log(f"Windows timezone set to {target}")
+        else:
+            log(f"Failed to set Windows timezone to {target}: {error('TZ')}")
+    if epoch is not None:
+        ok_time = "OK:TIME" in lines
+        if not ok_time:
+            log("Failed to set Windows time: " + error("TIME"))
+    return ok_tz, ok_time
 
 
-def set_time_linux_epoch(epoch):
-    if have("timedatectl"):
-        subprocess.run(["timedatectl", "set-ntp", "false"], capture_output=True)
+def _win32_set_system_time(epoch):
+    """
+    Set the clock through kernel32.SetSystemTime (UTC, so independent of the
+    timezone step). Returns False if the call is unavailable or refused, so
+    callers can fall back to powershell.
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+    except ImportError:
+        return False
 
-    proc = subprocess.run(
-        ["date", "-u", "-s", f"@{epoch}"],
-        capture_output=True,
-        text=True,
+    class SYSTEMTIME(ctypes.Structure):
+        _fields_ = [
+            (name, wintypes.WORD)
+            for name in (
+                "wYear", "wMonth", "wDayOfWeek", "wDay",
+                "wHour", "wMinute", "wSecond", "wMilliseconds",
+            )
+        ]
+
+    t = time.gmtime(epoch)
+    st = SYSTEMTIME(
+        t.tm_year, t.tm_mon, (t.tm_wday + 1) % 7, t.tm_mday,
+        t.tm_hour, t.tm_min, t.tm_sec, 0,
     )
-    ok = proc.returncode == 0
-    if not ok:
-        log("Failed to set Linux time: " + (proc.stderr or "").strip())
+    try:
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    except (AttributeError, OSError):
+        return False
+    if kernel32.SetSystemTime(ctypes.byref(st)):
+        return True
+    log(f"SetSystemTime failed (error {ctypes.get_last_error()}); trying powershell.")
+    return False
 
-    if have("timedatectl"):
-        subprocess.run(["timedatectl", "set-ntp", "true"], capture_output=True)
 
-    return ok
+def set_timezone_windows(tz_id, off):
+    target = _windows_tz_target(tz_id, off)
+    if not target:
+        return False
+    return _powershell_apply(target=target)[0]
 
 
 def set_time_windows_epoch(epoch):
-    stop_cmd = [
-        "powershell",
-        "-NoProfile",
-        "-Command",
-        "Stop-Service w32time -ErrorAction SilentlyContinue",
-    ]
-    start_cmd = [
-        "powershell",
-        "-NoProfile",
-        "-Command",
-        "Start-Service w32time -ErrorAction SilentlyContinue",
-    ]
-    set_cmd = [
-        "powershell",
-        "-NoProfile",
-        "-Command",
-        (
-            f"$u={epoch}; "
-            "$t=[DateTimeOffset]::FromUnixTimeSeconds($u).LocalDateTime; "
-            "Set-Date -Date $t"
-        ),
-    ]
-
-    subprocess.run(stop_cmd, capture_output=True, text=True)
-    proc = subprocess.run(set_cmd, capture_output=True, text=True)
-    ok = proc.returncode == 0
+    if _win32_set_system_time(epoch):
+        return True
+    return _powershell_apply(epoch=epoch)[1]
+
+
+def set_windows_tz_and_time(tz_id, off, epoch):
+    """Timezone and clock in at most one powershell launch; returns (ok_tz, ok_time)."""
+    target = _windows_tz_target(tz_id, off)
+    if _win32_set_system_time(epoch):
+        ok_tz = _powershell_apply(target=target)[0] if target else None
+        return bool(ok_tz), True
+    ok_tz, ok_time = _powershell_apply(target, epoch)
+    return bool(ok_tz), bool(ok_time)
+
+
+@functools.lru_cache(maxsize=None)
+def _ntp_enabled():
+    """Whether timedatectl reports NTP sync on; checked once per process."""
+    if not HAS_TIMEDATECTL:
+        return False
+    proc = run(["timedatectl", "show", "-p", "NTP", "--value"])
+    if proc.returncode != 0:
+        # older systemd without `show`: keep the set-ntp bracket to be safe
+        return True
+    return proc.stdout.strip() == "yes"
+
+
+def _clock_settime(epoch):
+    """clock_settime(CLOCK_REALTIME) through libc; False if unavailable or refused."""
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except (ImportError, OSError):
+        return False
+
+    class timespec(ctypes.Structure):
+        _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+    if libc.clock_settime(0, ctypes.byref(timespec(epoch, 0))) == 0:
+        return True
+    log(f"clock_settime failed: {os.strerror(ctypes.get_errno())}; trying date.")
+    return False
+
+
+def set_time_linux_epoch(epoch):
+    # NTP would pull the clock straight back; only toggle it if it is on
+    ntp = _ntp_enabled()
+    if ntp:
+        run_quiet(["timedatectl", "set-ntp", "false"])
+
+    ok = _clock_settime(epoch)
     if not ok:
-        log("Failed to set Windows time: " + (proc.stderr or "").strip())
-    subprocess.run(start_cmd, capture_output=True, text=True)
+        proc = run_stderr(["date", "-u", "-s", f"@{epoch}"])
+        ok = proc.returncode == 0
+        if not ok:
+            log("Failed to set Linux time: " + stderr_text(proc))
+
+    if ntp:
+        run_quiet(["timedatectl", "set-ntp", "true"])
+
     return ok
 
 
 
 def sync_once(serial, drift_threshold=1):
-    # grab time and timezone information from the phone
-    phone_ts = phone_epoch(serial)
+    global _LAST_APPLIED_TZ
+    # grab time and timezone information from the phone in one round-trip,
+    # falling back to the individual probes for anything it could not read
+    shell = adb_shell(serial)
+    info = take_probe(serial) or phone_info(shell)
+    phone_ts = info.get("epoch")
+    if phone_ts is None:
+        phone_ts = phone_epoch(shell)
     if phone_ts is None:
         log("Failed to read epoch from phone.")
         return False
 
-    phone_offset = phone_offset_hhmm(serial)
-    phone_tz = phone_tz_id(serial)
+    phone_offset = info.get("offset") or phone_offset_hhmm(shell)
+    phone_tz = info.get("tz") or phone_tz_id(shell)
 
     host_ts = int(time.time())
     drift = phone_ts - host_ts
@@ -479,21 +1182,32 @@ def sync_once(serial, drift_threshold=1):
 
     ok_tz = True
     ok_time = True
+    set_time = abs(drift) >= drift_threshold
+    # timedatectl / Set-TimeZone are slow; don't reapply what the last sync set
+    tz_unchanged = (phone_tz, phone_offset) == _LAST_APPLIED_TZ
+    if tz_unchanged:
+        log("Phone timezone unchanged since last sync; skipping timezone change.")
 
-    if os_is_windows():
+    if IS_WINDOWS:
         elevate_windows()
-        ok_tz = set_timezone_windows(phone_tz, phone_offset)
-        if abs(drift) >= drift_threshold:
-            ok_time = set_time_windows_epoch(phone_ts)
+        if tz_unchanged:
+            if set_time:
+                ok_time = set_time_windows_epoch(phone_ts)
+        elif set_time:
+            ok_tz, ok_time = set_windows_tz_and_time(phone_tz, phone_offset, phone_ts)
         else:
-            log("Drift below threshold; skipping time change.")
+            ok_tz = set_timezone_windows(phone_tz, phone_offset)
     else:
         elevate_linux()
-        ok_tz = set_timezone_linux(phone_tz, phone_offset)
-        if abs(drift) >= drift_threshold:
+        if not tz_unchanged:
+            ok_tz = set_timezone_linux(phone_tz, phone_offset)
+        if set_time:
             ok_time = set_time_linux_epoch(phone_ts)
-        else:
-            log("Drift below threshold; skipping time change.")
+
+    if not set_time:
+        log("Drift below threshold; skipping time change.")
+    if ok_tz:
+        _LAST_APPLIED_TZ = (phone_tz, phone_offset)
 
     if ok_tz and ok_time:
         log("System time and timezone updated.")
@@ -507,15 +1221,18 @@ def sync_once(serial, drift_threshold=1):
     return ok_tz and ok_time
 
 
-def cmd_list():
-    devices = adb_devices()
+def cmd_list(devices=None):
+    if devices is None:
+        devices = adb_devices()
     if not devices:
         log("No ADB devices found.")
         return 1
 
+    models = device_models(devices, load_cfg())
     log("Detected devices:")
     for idx, (serial, state) in enumerate(devices, 1):
-        log(f"  {idx}: {serial} [{state}]")
+        model = f" ({models[serial]})" if serial in models else ""
+        log(f"  {idx}: {serial} [{state}]{model}")
     return 0
 
 
@@ -526,7 +1243,7 @@ def cmd_device(args):
         return 1
 
     if not args:
-        return cmd_list()
+        return cmd_list(devices)
 
     try:
         idx = int(args[0])
@@ -553,28 +1270,51 @@ def cmd_reset():
 
 
 def cmd_resync():
+    ensure_adb_server()
     cfg = load_cfg()
     serial = pick_serial(cfg.get("selected_serial"))
     if not serial:
         log("No devices detected. Waiting for one...")
-        subprocess.run(["adb", "wait-for-device"], capture_output=True, text=True)
+        flush_log()
+        run_quiet(["adb", "wait-for-device"])
         serial = pick_serial(None)
         if not serial:
             log("Still no device.")
             return 1
 
-    log(f"Using device: {serial} ({device_model(serial)})")
+    log(f"Using device: {serial} ({device_model_cached(serial, cfg)})")
     wait_for_authorized(serial)
-    return 0 if sync_once(serial) else 1
+    if not sync_once(serial):
+        return 1
+    remember_success(serial)
+    return 0
+
+
+def remember_success(serial):
+    """Persist the last serial that synced, so the next boot can try it first."""
+    cfg = load_cfg()
+    if cfg.get("last_success_serial") != serial:
+        cfg["last_success_serial"] = serial
+        save_cfg(cfg)
 
 
 def _handle_signal(sig, frame):
     log(f"Received signal {sig}; exiting.")
+    _STOP.set()
+    close_adb_shells()
     close_log()
     sys.exit(0)
 
 
 def run_boot_cycle(oneshot=False):
+    tracker = DeviceTracker()
+    try:
+        _run_boot_cycle(tracker, oneshot)
+    finally:
+        tracker.close()
+
+
+def _run_boot_cycle(tracker, oneshot):
     connect_target = os.environ.get("ADB_CONNECT", "").strip()
     discovery_interval = int(os.environ.get("DISCOVERY_INTERVAL", "5"))
     startup_window = int(os.environ.get("STARTUP_WINDOW", "900"))
@@ -586,25 +1326,58 @@ def run_boot_cycle(oneshot=False):
         f"then refresh every {refresh_interval}s on success."
     )
 
-    if not have("adb"):
+    if not HAS_ADB:
         log("adb not in PATH. Exiting.")
         sys.exit(127)
 
-    run(["adb", "start-server"])
+    ensure_adb_server()
     start_time = time.monotonic()
     had_success = False
     last_serial = None
+    empty_ticks = 0
+    err_streak = 0
+
+    # the device that synced last time is usually already plugged in and
+    # authorized, so start on the fast path below with it
+    cfg = load_cfg()
+    steady = cfg.get("last_success_serial")
 
     while True:
         try:
+            # no-op unless an adb error since the last tick cleared the flag
+            ensure_adb_server()
+
+            # Fast path: while the last synced device still answers the probe,
+            # skip connect, enumeration, selection and the authorization wait.
+            # The config read is a stat unless `toadb device` changed it.
+            cfg = load_cfg()
+            if (
+                steady
+                and cfg.get("selected_serial") in (None, steady)
+                and _authorized_probe(steady)
+            ):
+                if steady != last_serial:
+                    log(f"Watching device: {steady} ({device_model_cached(steady, cfg)})")
+                    last_serial = steady
+                if sync_once(steady, drift_threshold=drift_threshold):
+                    had_success = True
+                    err_streak = 0
+                    remember_success(steady)
+                    if oneshot:
+                        return
+                    if _idle(refresh_interval):
+                        return
+                    continue
+            # probe or sync failed: take the full path in this same tick
+            steady = None
+
             if connect_target:
-                subprocess.run(
-                    ["adb", "connect", connect_target],
-                    capture_output=True,
-                    text=True,
-                )
+                run_quiet(["adb", "connect", connect_target])
 
-            devices = adb_devices()
+            # pushed by the adb server; fork `adb devices` only if it is unreachable
+            devices = tracker.current()
+            if devices is None:
+                devices = adb_devices()
             if not devices:
                 if oneshot:
                     log("No devices; oneshot mode exiting.")
@@ -614,12 +1387,16 @@ def run_boot_cycle(oneshot=False):
                         "No device authorized within startup window; exiting until next boot."
                     )
                     sys.exit(0)
-                time.sleep(discovery_interval)
+                # nothing attached: sleep until the server reports a device, backing
+                # off to 2x, then 4x the interval between adb connect attempts
+                if tracker.wait_for_device(discovery_interval * 2 ** min(empty_ticks, 2)):
+                    return
+                empty_ticks += 1
                 continue
+            empty_ticks = 0
 
-            cfg = load_cfg()
             prefer = cfg.get("selected_serial")
-            serial = pick_serial(prefer)
+            serial = pick_serial(prefer, devices, cfg)
 
             online_count = sum(1 for _, st in devices if st == "device")
             if online_count > 1 and not prefer:
@@ -629,19 +1406,24 @@ def run_boot_cycle(oneshot=False):
                 )
 
             if serial != last_serial:
-                log(f"Watching device: {serial} ({device_model(serial)})")
+                log(f"Watching device: {serial} ({device_model_cached(serial, cfg)})")
                 last_serial = serial
 
-            wait_for_authorized(serial)
+            state = next((st for s, st in devices if s == serial), None)
+            wait_for_authorized(serial, state, tracker)
 
             if sync_once(serial, drift_threshold=drift_threshold):
                 had_success = True
+                err_streak = 0
+                remember_success(serial)
+                steady = serial
 
             if oneshot:
                 return
 
             if had_success:
-                time.sleep(refresh_interval)
+                if _idle(refresh_interval):
+                    return
             else:
                 if time.monotonic() - start_time >= startup_window:
                     log(
@@ -649,46 +1431,32 @@ def run_boot_cycle(oneshot=False):
                         "exiting until next boot."
                     )
                     sys.exit(0)
-                time.sleep(discovery_interval)
+                if _idle(discovery_interval):
+                    return
 
-        except Exception as exc:
+        # adb/OS hiccups and bad phone output are retried; anything else is a
+        # bug and should surface instead of looping forever
+        except (subprocess.SubprocessError, OSError, ValueError) as exc:
             log(f"[warn] loop error: {exc}")
             if oneshot:
                 return
-            if had_success:
-                time.sleep(refresh_interval)
-            else:
-                if time.monotonic() - start_time >= startup_window:
-                    log(
-                        "Startup window expired after errors; exiting until next boot."
-                    )
-                    sys.exit(0)
-                time.sleep(discovery_interval)
+            if not had_success and time.monotonic() - start_time >= startup_window:
+                log(
+                    "Startup window expired after errors; exiting until next boot."
+                )
+                sys.exit(0)
+            # back off on repeated errors, never waiting longer than a refresh
+            err_streak += 1
+            if _idle(min(refresh_interval, discovery_interval * 2 ** min(err_streak, 5))):
+                return
 
 
 def main():
-    _open_log_file()
-    for sig in (signal.SIGTERM, signal.SIGINT):
-        try:
-            signal.signal(sig, _handle_signal)
-        except Exception:
-            pass
-
     args = sys.argv[1:]
-
-    if not args:
-        run_boot_cycle()
-        close_log()
-        return
-
-    if args[0] in ("--oneshot", "oneshot"):
-        run_boot_cycle(oneshot=True)
-        close_log()
-        return
-
-    cmd = args[0].lower()
+    cmd = args[0].lower() if args else ""
     rest = args[1:]
 
+    # pure-info command: no log file, no signal handlers
     if cmd in ("help", "-h", "--help"):
         print(
             """toadb commands:
@@ -708,6 +1476,23 @@ Env vars:
   DRIFT_THRESHOLD=1
 """
         )
+        return
+
+    if cmd in ("", "oneshot", "--oneshot", "resync"):
+        _open_log_file()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            signal.signal(sig, _handle_signal)
+        except Exception:
+            pass
+
+    if not args:
+        run_boot_cycle()
+        close_log()
+        return
+
+    if cmd in ("--oneshot", "oneshot"):
+        run_boot_cycle(oneshot=True)
         close_log()
         return
 